@@ -108,12 +108,20 @@ final class DailyChecklist: Identifiable {
     }
 
     var completedCount: Int {
-        items.filter(\.isCompleted).count
+        items.reduce(into: 0) { count, item in
+            if item.isCompleted { count += 1 }
+        }
     }
 
     var completionPercentage: Int {
-        guard !items.isEmpty else { return 0 }
-        return Int((Double(completedCount) / Double(items.count) * 100).rounded())
+        var total = 0
+        var completed = 0
+        for item in items {
+            total += 1
+            if item.isCompleted { completed += 1 }
+        }
+        guard total > 0 else { return 0 }
+        return Int((Double(completed) / Double(total) * 100).rounded())
     }
 }
 
@@ -230,12 +238,20 @@ final class CollectionList: Identifiable {
     }
 
     var completedCount: Int {
-        items.filter(\.isCompleted).count
+        items.reduce(into: 0) { count, item in
+            if item.isCompleted { count += 1 }
+        }
     }
 
     var completionPercentage: Int {
-        guard !items.isEmpty else { return 0 }
-        return Int((Double(completedCount) / Double(items.count) * 100).rounded())
+        var total = 0
+        var completed = 0
+        for item in items {
+            total += 1
+            if item.isCompleted { completed += 1 }
+        }
+        guard total > 0 else { return 0 }
+        return Int((Double(completed) / Double(total) * 100).rounded())
     }
 }
 
@@ -17,8 +17,9 @@ enum ChecklistStore {
 
         if let existing = try context.fetch(descriptor).first {
             if createIfMissing {
-                try materializeTemplateItems(into: existing, in: context)
-                try context.save()
+                if try materializeTemplateItems(into: existing, in: context) {
+                    try context.save()
+                }
                 WidgetChecklistSync.publish(existing)
             }
             return existing
@@ -71,10 +72,11 @@ enum ChecklistStore {
     ) throws {
         let checklist = item.checklist
         let nextValue = isCompleted ?? !item.isCompleted
+        let now = Date.now
         item.isCompleted = nextValue
-        item.completedAt = nextValue ? .now : nil
-        item.updatedAt = .now
-        item.checklist?.updatedAt = .now
+        item.completedAt = nextValue ? now : nil
+        item.updatedAt = now
+        item.checklist?.updatedAt = now
         try context.save()
         if let checklist {
             WidgetChecklistSync.publish(checklist)
@@ -85,20 +87,26 @@ enum ChecklistStore {
         _ item: DailyChecklistItem,
         title: String,
         notes: String,
+        isPersistent: Bool? = nil,
         in context: ModelContext
     ) throws {
         let cleanTitle = title.trimmingCharacters(in: .whitespacesAndNewlines)
+        let now = Date.now
         item.title = cleanTitle
         item.notes = notes
-        item.updatedAt = .now
-        item.checklist?.updatedAt = .now
+        item.updatedAt = now
+        item.checklist?.updatedAt = now
+
+        if let isPersistent, isPersistent != item.isPersistent {
+            try applyPersistence(for: item, isPersistent: isPersistent, at: now, in: context)
+        }
 
         if item.isPersistent, let templateID = item.templateID {
             try updateTemplateAndFutureCopies(
                 templateID: templateID,
                 title: cleanTitle,
                 notes: notes,
-                from: DateKeys.startOfDay(.now),
+                from: DateKeys.startOfDay(now),
                 in: context
             )
         }
@@ -113,6 +121,22 @@ enum ChecklistStore {
         for item: DailyChecklistItem,
         isPersistent: Bool,
         in context: ModelContext
+    ) throws {
+        let now = Date.now
+        try applyPersistence(for: item, isPersistent: isPersistent, at: now, in: context)
+        item.updatedAt = now
+        item.checklist?.updatedAt = now
+        try context.save()
+        if let checklist = item.checklist {
+            WidgetChecklistSync.publish(checklist)
+        }
+    }
+
+    private static func applyPersistence(
+        for item: DailyChecklistItem,
+        isPersistent: Bool,
+        at now: Date,
+        in context: ModelContext
     ) throws {
         if isPersistent {
             let template: ChecklistTemplateItem
@@ -130,7 +154,7 @@ enum ChecklistStore {
             template.title = item.title
             template.notes = item.notes
             template.isActive = true
-            template.updatedAt = .now
+            template.updatedAt = now
             item.isPersistent = true
             item.templateID = template.id
         } else {
@@ -140,13 +164,6 @@ enum ChecklistStore {
             item.isPersistent = false
             item.templateID = nil
         }
-
-        item.updatedAt = .now
-        item.checklist?.updatedAt = .now
-        try context.save()
-        if let checklist = item.checklist {
-            WidgetChecklistSync.publish(checklist)
-        }
     }
 
     static func deleteItem(
@@ -175,27 +192,38 @@ enum ChecklistStore {
         return try context.fetch(descriptor)
     }
 
+    @discardableResult
     private static func materializeTemplateItems(
         into checklist: DailyChecklist,
         in context: ModelContext
-    ) throws {
+    ) throws -> Bool {
         let templates = try activeTemplates(in: context)
         let existingTemplateIDs = Set(checklist.items.compactMap(\.templateID))
 
+        var didAddItems = false
+        let now = Date.now
+        var nextSortOrder = checklist.items.count
         for template in templates where !existingTemplateIDs.contains(template.id) {
             let item = DailyChecklistItem(
                 title: template.title,
                 notes: template.notes,
                 isPersistent: true,
                 templateID: template.id,
-                sortOrder: checklist.items.count,
+                sortOrder: nextSortOrder,
+                createdAt: now,
+                updatedAt: now,
                 checklist: checklist
             )
+            nextSortOrder += 1
             checklist.items.append(item)
             context.insert(item)
+            didAddItems = true
         }
 
-        checklist.updatedAt = .now
+        if didAddItems {
+            checklist.updatedAt = now
+        }
+        return didAddItems
     }
 
     private static func existingTemplate(
@@ -240,10 +268,11 @@ enum ChecklistStore {
             }
         )
         templateDescriptor.fetchLimit = 1
+        let now = Date.now
         if let template = try context.fetch(templateDescriptor).first {
             template.title = title
             template.notes = notes
-            template.updatedAt = .now
+            template.updatedAt = now
         }
 
         let itemDescriptor = FetchDescriptor<DailyChecklistItem>(
@@ -255,7 +284,7 @@ enum ChecklistStore {
         for copy in try context.fetch(itemDescriptor) where (copy.checklist?.date ?? .distantPast) >= startDate {
             copy.title = title
             copy.notes = notes
-            copy.updatedAt = .now
+            copy.updatedAt = now
         }
     }
 }
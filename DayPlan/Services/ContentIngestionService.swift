@@ -1,4 +1,5 @@
 import Foundation
+import OSLog
 import SwiftData
 
 struct ContentRefreshFailure: Equatable {
@@ -24,7 +25,15 @@ struct ContentRefreshReport: Equatable {
 
 @MainActor
 enum ContentIngestionService {
+    private static let signposter = OSSignposter(
+        subsystem: "com.jakemauldin.DayPlan",
+        category: "ContentRefresh"
+    )
+
     static func refreshYesterday(in context: ModelContext, now: Date = .now) async throws -> ContentRefreshReport {
+        let interval = signposter.beginInterval("refreshYesterday")
+        defer { signposter.endInterval("refreshYesterday", interval) }
+
         let day = DateKeys.yesterday(from: now)
         let end = DateKeys.dayAfter(day)
         var sources = try fetchSources(in: context)
@@ -74,6 +83,9 @@ enum ContentIngestionService {
         until endDate: Date,
         in context: ModelContext
     ) async throws -> ContentRefreshReport {
+        let interval = signposter.beginInterval("ingest")
+        defer { signposter.endInterval("ingest", interval) }
+
         var report = ContentRefreshReport()
 
         for adapter in adapters {
@@ -82,8 +94,12 @@ enum ContentIngestionService {
 
             do {
                 let drafts = try await adapter.fetchContent(since: startDate, until: endDate)
-                let existingEvents = try fetchEvents(from: startDate, until: endDate, in: context)
-                    .filter { $0.sourceIdentifier == source.identifier }
+                let existingEvents = try fetchEvents(
+                    forSourceIdentifier: source.identifier,
+                    from: startDate,
+                    until: endDate,
+                    in: context
+                )
                 var existingByID: [String: ContentEvent] = [:]
                 for event in existingEvents {
                     existingByID[event.externalID] = event
@@ -92,13 +108,14 @@ enum ContentIngestionService {
                 var importedForSource = 0
                 for draft in drafts {
                     if let event = existingByID.removeValue(forKey: draft.id) {
-                        event.sourceName = draft.sourceName
-                        event.receivedAt = draft.receivedAt
-                        event.title = draft.title
-                        event.body = draft.body
-                        event.urlString = draft.url?.absoluteString
-                        event.category = draft.category
-                        event.source = source
+                        let urlString = draft.url?.absoluteString
+                        if event.sourceName != draft.sourceName { event.sourceName = draft.sourceName }
+                        if event.receivedAt != draft.receivedAt { event.receivedAt = draft.receivedAt }
+                        if event.title != draft.title { event.title = draft.title }
+                        if event.body != draft.body { event.body = draft.body }
+                        if event.urlString != urlString { event.urlString = urlString }
+                        if event.categoryRawValue != draft.category.rawValue { event.category = draft.category }
+                        if event.source !== source { event.source = source }
                     } else {
                         let event = ContentEvent(
                             externalID: draft.id,
@@ -154,6 +171,22 @@ enum ContentIngestionService {
         return try context.fetch(descriptor)
     }
 
+    private static func fetchEvents(
+        forSourceIdentifier sourceIdentifier: String,
+        from startDate: Date,
+        until endDate: Date,
+        in context: ModelContext
+    ) throws -> [ContentEvent] {
+        let descriptor = FetchDescriptor<ContentEvent>(
+            predicate: #Predicate { event in
+                event.sourceIdentifier == sourceIdentifier
+                    && event.receivedAt >= startDate
+                    && event.receivedAt < endDate
+            }
+        )
+        return try context.fetch(descriptor)
+    }
+
     static func fetchSources(in context: ModelContext) throws -> [ContentSource] {
         try context.fetch(FetchDescriptor<ContentSource>(sortBy: [SortDescriptor(\.name)]))
     }
@@ -192,8 +225,10 @@ enum ContentIngestionService {
         descriptor.fetchLimit = 1
 
         if let existing = try context.fetch(descriptor).first {
-            existing.name = adapter.displayName
-            existing.updatedAt = .now
+            if existing.name != adapter.displayName {
+                existing.name = adapter.displayName
+                existing.updatedAt = .now
+            }
             return existing
         }
 
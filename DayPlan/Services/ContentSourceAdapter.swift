@@ -258,6 +258,9 @@ private final class FeedXMLParserDelegate: NSObject, XMLParserDelegate {
     let startDate: Date
     let endDate: Date
 
+    private let includeKeywords: [String]
+    private let excludeKeywords: [String]
+
     private(set) var drafts: [ContentEventDraft] = []
     private var currentItem: ItemBuilder?
     private var currentText = ""
@@ -266,6 +269,12 @@ private final class FeedXMLParserDelegate: NSObject, XMLParserDelegate {
         self.configuration = configuration
         self.startDate = startDate
         self.endDate = endDate
+        includeKeywords = configuration.includeKeywords
+            .map(\.localizedLowercase)
+            .filter { !$0.isEmpty }
+        excludeKeywords = configuration.excludeKeywords
+            .map(\.localizedLowercase)
+            .filter { !$0.isEmpty }
     }
 
     func parser(
@@ -373,18 +382,13 @@ private final class FeedXMLParserDelegate: NSObject, XMLParserDelegate {
     }
 
     private func matchesFilters(title: String, body: String) -> Bool {
-        let searchable = "\(title) \(body)".localizedLowercase
-        let includes = configuration.includeKeywords
-            .map(\.localizedLowercase)
-            .filter { !$0.isEmpty }
-        let excludes = configuration.excludeKeywords
-            .map(\.localizedLowercase)
-            .filter { !$0.isEmpty }
+        guard !includeKeywords.isEmpty || !excludeKeywords.isEmpty else { return true }
 
-        guard includes.isEmpty || includes.contains(where: searchable.contains) else {
+        let searchable = "\(title) \(body)".localizedLowercase
+        guard includeKeywords.isEmpty || includeKeywords.contains(where: searchable.contains) else {
             return false
         }
-        return !excludes.contains(where: searchable.contains)
+        return !excludeKeywords.contains(where: searchable.contains)
     }
 
     private func normalized(_ elementName: String) -> String {
@@ -399,27 +403,37 @@ private final class FeedXMLParserDelegate: NSObject, XMLParserDelegate {
 }
 
 private enum FeedDateParser {
+    private static let isoFractionalFormatter: ISO8601DateFormatter = {
+        let formatter = ISO8601DateFormatter()
+        formatter.formatOptions = [.withInternetDateTime, .withFractionalSeconds]
+        return formatter
+    }()
+
+    private static let isoFormatter: ISO8601DateFormatter = {
+        let formatter = ISO8601DateFormatter()
+        formatter.formatOptions = [.withInternetDateTime]
+        return formatter
+    }()
+
+    private static let rfc822Formatters: [DateFormatter] = [
+        "EEE, dd MMM yyyy HH:mm:ss Z",
+        "dd MMM yyyy HH:mm:ss Z",
+        "EEE, dd MMM yyyy HH:mm Z"
+    ].map { format in
+        let formatter = DateFormatter()
+        formatter.locale = Locale(identifier: "en_US_POSIX")
+        formatter.dateFormat = format
+        return formatter
+    }
+
     static func date(from value: String) -> Date? {
-        let isoFormatter = ISO8601DateFormatter()
-        isoFormatter.formatOptions = [.withInternetDateTime, .withFractionalSeconds]
-        if let date = isoFormatter.date(from: value) {
+        if let date = isoFractionalFormatter.date(from: value) {
             return date
         }
-
-        isoFormatter.formatOptions = [.withInternetDateTime]
         if let date = isoFormatter.date(from: value) {
             return date
         }
-
-        let formats = [
-            "EEE, dd MMM yyyy HH:mm:ss Z",
-            "dd MMM yyyy HH:mm:ss Z",
-            "EEE, dd MMM yyyy HH:mm Z"
-        ]
-        for format in formats {
-            let formatter = DateFormatter()
-            formatter.locale = Locale(identifier: "en_US_POSIX")
-            formatter.dateFormat = format
+        for formatter in rfc822Formatters {
             if let date = formatter.date(from: value) {
                 return date
             }
@@ -429,26 +443,75 @@ private enum FeedDateParser {
 }
 
 private enum FeedTextSanitizer {
+    private static let tagExpression = try! NSRegularExpression(pattern: "<[^>]+>")
+    private static let whitespaceRunExpression = try! NSRegularExpression(pattern: "\\s+")
+
+    private static let entityReplacements: [(entity: String, replacement: Character)] = [
+        ("&nbsp;", " "),
+        ("&amp;", "&"),
+        ("&lt;", "<"),
+        ("&gt;", ">"),
+        ("&quot;", "\""),
+        ("&#39;", "'")
+    ]
+
     static func clean(_ value: String, limit: Int) -> String {
-        let withoutTags = value.replacingOccurrences(
-            of: "<[^>]+>",
-            with: " ",
-            options: .regularExpression
-        )
-        let decoded = withoutTags
-            .replacingOccurrences(of: "&nbsp;", with: " ")
-            .replacingOccurrences(of: "&amp;", with: "&")
-            .replacingOccurrences(of: "&lt;", with: "<")
-            .replacingOccurrences(of: "&gt;", with: ">")
-            .replacingOccurrences(of: "&quot;", with: "\"")
-            .replacingOccurrences(of: "&#39;", with: "'")
-        let collapsed = decoded.replacingOccurrences(
-            of: "\\s+",
-            with: " ",
-            options: .regularExpression
-        )
+        let bounded = boundedScanPrefix(of: value, limit: limit)
+        let withoutTags = bounded.contains("<")
+            ? replacingMatches(of: tagExpression, in: bounded, with: " ")
+            : bounded
+        let decoded = decodingEntities(withoutTags)
+        let collapsed = replacingMatches(of: whitespaceRunExpression, in: decoded, with: " ")
         return String(collapsed.trimmingCharacters(in: .whitespacesAndNewlines).prefix(limit))
     }
+
+    /// Caps how much raw markup the regex passes scan. Tags and entities only
+    /// shrink text, so a generous multiple of the output limit preserves the
+    /// result for ordinary feeds while bounding the work an oversized or
+    /// adversarial body can cause.
+    private static func boundedScanPrefix(of value: String, limit: Int) -> String {
+        let scanLimit = max(limit * 8, 2_048)
+        guard value.count > scanLimit else { return value }
+
+        var prefix = String(value.prefix(scanLimit))
+        if let lastOpen = prefix.lastIndex(of: "<"),
+           prefix[lastOpen...].firstIndex(of: ">") == nil {
+            prefix = String(prefix[..<lastOpen])
+        }
+        return prefix
+    }
+
+    private static func decodingEntities(_ value: String) -> String {
+        guard value.contains("&") else { return value }
+
+        var result = ""
+        result.reserveCapacity(value.count)
+        var index = value.startIndex
+        while index < value.endIndex {
+            let character = value[index]
+            if character == "&",
+               let match = entityReplacements.first(where: { value[index...].hasPrefix($0.entity) }) {
+                result.append(match.replacement)
+                index = value.index(index, offsetBy: match.entity.count)
+            } else {
+                result.append(character)
+                index = value.index(after: index)
+            }
+        }
+        return result
+    }
+
+    private static func replacingMatches(
+        of expression: NSRegularExpression,
+        in value: String,
+        with template: String
+    ) -> String {
+        expression.stringByReplacingMatches(
+            in: value,
+            range: NSRange(value.startIndex..., in: value),
+            withTemplate: template
+        )
+    }
 }
 
 struct SampleContentAdapter: ContentSourceAdapter {
@@ -41,6 +41,8 @@ enum ContentSuggestionService {
         "urgent"
     ]
 
+    private static let normalizedActionKeywords = Set(actionKeywords.map { normalizedTitle($0) })
+
     static func supportsSuggestions(for date: Date, now: Date = .now) -> Bool {
         DateKeys.startOfDay(date) == DateKeys.startOfDay(now)
     }
@@ -80,8 +82,14 @@ enum ContentSuggestionService {
                 }
 
                 let sourceCount = sourceCounts[event.sourceIdentifier] ?? 1
-                let score = score(for: event, sourceEventCount: sourceCount, dayStart: yesterday)
-                guard score >= minimumScore else { return nil }
+                let category = event.category
+                let breakdown = scoreBreakdown(
+                    for: event,
+                    category: category,
+                    sourceEventCount: sourceCount,
+                    dayStart: yesterday
+                )
+                guard breakdown.total >= minimumScore else { return nil }
 
                 return SuggestedChecklistItem(
                     eventKey: eventKey,
@@ -89,11 +97,11 @@ enum ContentSuggestionService {
                     title: event.title.trimmingCharacters(in: .whitespacesAndNewlines),
                     excerpt: collapsedText(event.body, limit: 180),
                     sourceName: event.sourceName,
-                    category: event.category,
+                    category: category,
                     url: allowedURL(from: event.urlString),
                     receivedAt: event.receivedAt,
-                    score: score,
-                    reason: reason(for: event, sourceEventCount: sourceCount, dayStart: yesterday)
+                    score: breakdown.total,
+                    reason: reason(for: event, category: category, breakdown: breakdown)
                 )
             }
             .sorted(by: suggestionSort)
@@ -177,10 +185,12 @@ enum ContentSuggestionService {
         sourceEventCount: Int,
         dayStart: Date
     ) -> Int {
-        categoryPoints(for: event.category)
-            + actionPoints(for: event)
-            + recencyPoints(for: event.receivedAt, dayStart: dayStart)
-            + sourceActivityPoints(for: sourceEventCount)
+        scoreBreakdown(
+            for: event,
+            category: event.category,
+            sourceEventCount: sourceEventCount,
+            dayStart: dayStart
+        ).total
     }
 
     static func normalizedTitle(_ title: String) -> String {
@@ -268,21 +278,41 @@ enum ContentSuggestionService {
         return left.eventKey < right.eventKey
     }
 
-    private static func reason(
+    private struct ScoreBreakdown {
+        let category: Int
+        let action: Int
+        let recency: Int
+        let sourceActivity: Int
+
+        var total: Int {
+            category + action + recency + sourceActivity
+        }
+    }
+
+    private static func scoreBreakdown(
         for event: ContentEvent,
+        category: ContentCategory,
         sourceEventCount: Int,
         dayStart: Date
-    ) -> String {
-        let actionScore = actionPoints(for: event)
-        let categoryScore = categoryPoints(for: event.category)
-        let recencyScore = recencyPoints(for: event.receivedAt, dayStart: dayStart)
-        let sourceScore = sourceActivityPoints(for: sourceEventCount)
+    ) -> ScoreBreakdown {
+        ScoreBreakdown(
+            category: categoryPoints(for: category),
+            action: actionPoints(for: event),
+            recency: recencyPoints(for: event.receivedAt, dayStart: dayStart),
+            sourceActivity: sourceActivityPoints(for: sourceEventCount)
+        )
+    }
 
+    private static func reason(
+        for event: ContentEvent,
+        category: ContentCategory,
+        breakdown: ScoreBreakdown
+    ) -> String {
         let contributors: [(points: Int, priority: Int, reason: String)] = [
-            (categoryScore, 0, categoryReason(for: event.category)),
-            (actionScore, 1, "Action-oriented wording suggests a follow-up"),
-            (recencyScore, 2, "One of yesterday's most recent items"),
-            (sourceScore, 3, "Repeated activity from \(event.sourceName)")
+            (breakdown.category, 0, categoryReason(for: category)),
+            (breakdown.action, 1, "Action-oriented wording suggests a follow-up"),
+            (breakdown.recency, 2, "One of yesterday's most recent items"),
+            (breakdown.sourceActivity, 3, "Repeated activity from \(event.sourceName)")
         ]
 
         return contributors
@@ -318,8 +348,7 @@ enum ContentSuggestionService {
 
     private static func actionPoints(for event: ContentEvent) -> Int {
         let text = " \(normalizedTitle(collapsedText("\(event.title) \(event.body)", limit: 2_000))) "
-        let keywords = Set(actionKeywords.map { normalizedTitle($0) })
-        let matches = keywords.filter { text.contains(" \($0) ") }.count
+        let matches = normalizedActionKeywords.filter { text.contains(" \($0) ") }.count
         return min(matches, 3) * 12
     }
 
@@ -342,11 +371,13 @@ enum ContentSuggestionService {
         return url
     }
 
+    private static let whitespaceRunExpression = try! NSRegularExpression(pattern: "\\s+")
+
     private static func collapsedText(_ value: String, limit: Int) -> String {
-        let collapsed = value.replacingOccurrences(
-            of: "\\s+",
-            with: " ",
-            options: .regularExpression
+        let collapsed = whitespaceRunExpression.stringByReplacingMatches(
+            in: value,
+            range: NSRange(value.startIndex..., in: value),
+            withTemplate: " "
         )
         return String(collapsed.trimmingCharacters(in: .whitespacesAndNewlines).prefix(limit))
     }
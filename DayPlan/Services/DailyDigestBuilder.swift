@@ -10,9 +10,11 @@ enum DailyDigestBuilder {
         let summary = summaryText(for: events, date: day)
 
         if let existing = try existingDigest(for: day, in: context) {
-            existing.summary = summary
-            existing.generatedAt = .now
-            try context.save()
+            if existing.summary != summary {
+                existing.summary = summary
+                existing.generatedAt = .now
+                try context.save()
+            }
             return existing
         }
 
@@ -27,23 +29,27 @@ enum DailyDigestBuilder {
             return "No source items were captured for \(DateKeys.dayKey(for: date))."
         }
 
-        let sourceCounts = Dictionary(grouping: events, by: \.sourceName)
-            .mapValues(\.count)
-            .sorted { left, right in
-                if left.value == right.value { return left.key < right.key }
-                return left.value > right.value
-            }
-
-        let categoryCounts = Dictionary(grouping: events, by: { $0.category.displayName })
-            .mapValues(\.count)
-            .sorted { left, right in
-                if left.value == right.value { return left.key < right.key }
-                return left.value > right.value
+        var sourceCounts: [String: Int] = [:]
+        var categoryCounts: [String: Int] = [:]
+        var newest: ContentEvent?
+        for event in events {
+            sourceCounts[event.sourceName, default: 0] += 1
+            categoryCounts[event.category.displayName, default: 0] += 1
+            if let current = newest {
+                if event.receivedAt > current.receivedAt {
+                    newest = event
+                }
+            } else {
+                newest = event
             }
+        }
 
-        let topSource = sourceCounts.first.map { "\($0.key) was the busiest source with \($0.value) item(s)." }
-        let topCategory = categoryCounts.first.map { "\($0.key) was the most common category." }
-        let newest = events.sorted { $0.receivedAt > $1.receivedAt }.first
+        let topSource = topEntry(of: sourceCounts).map {
+            "\($0.key) was the busiest source with \($0.value) item(s)."
+        }
+        let topCategory = topEntry(of: categoryCounts).map {
+            "\($0.key) was the most common category."
+        }
         let newestLine = newest.map { "Most recent: \($0.title)." }
 
         return [
@@ -56,6 +62,13 @@ enum DailyDigestBuilder {
         .joined(separator: " ")
     }
 
+    private static func topEntry(of counts: [String: Int]) -> (key: String, value: Int)? {
+        counts.min { left, right in
+            if left.value == right.value { return left.key < right.key }
+            return left.value > right.value
+        }
+    }
+
     private static func existingDigest(
         for date: Date,
         in context: ModelContext
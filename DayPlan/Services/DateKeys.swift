@@ -15,9 +15,15 @@ enum DateKeys {
 
     static func dayKey(for date: Date, calendar: Calendar = .current) -> String {
         let components = calendar.dateComponents([.year, .month, .day], from: date)
-        let year = components.year ?? 0
-        let month = components.month ?? 0
-        let day = components.day ?? 0
-        return String(format: "%04d-%02d-%02d", year, month, day)
+        let year = padded(components.year ?? 0, to: 4)
+        let month = padded(components.month ?? 0, to: 2)
+        let day = padded(components.day ?? 0, to: 2)
+        return "\(year)-\(month)-\(day)"
+    }
+
+    private static func padded(_ value: Int, to width: Int) -> String {
+        let digits = String(value)
+        guard digits.count < width else { return digits }
+        return String(repeating: "0", count: width - digits.count) + digits
     }
 }
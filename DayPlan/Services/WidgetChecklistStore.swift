@@ -3,7 +3,7 @@ import Foundation
 import UserNotifications
 import WidgetKit
 
-struct WidgetChecklistItem: Codable, Hashable, Identifiable, Sendable {
+struct WidgetChecklistItem: Hashable, Identifiable, Sendable {
     let id: UUID
     let title: String
     let isCompleted: Bool
@@ -11,13 +11,45 @@ struct WidgetChecklistItem: Codable, Hashable, Identifiable, Sendable {
     let reminderIdentifiers: [String]
 }
 
+extension WidgetChecklistItem: Codable {
+    private enum CodingKeys: String, CodingKey {
+        case id
+        case title
+        case isCompleted
+        case sortOrder
+        case reminderIdentifiers
+    }
+
+    init(from decoder: Decoder) throws {
+        let container = try decoder.container(keyedBy: CodingKeys.self)
+        id = try container.decode(UUID.self, forKey: .id)
+        title = try container.decode(String.self, forKey: .title)
+        isCompleted = try container.decode(Bool.self, forKey: .isCompleted)
+        sortOrder = try container.decode(Int.self, forKey: .sortOrder)
+        reminderIdentifiers = try container.decodeIfPresent([String].self, forKey: .reminderIdentifiers) ?? []
+    }
+
+    func encode(to encoder: Encoder) throws {
+        var container = encoder.container(keyedBy: CodingKeys.self)
+        try container.encode(id, forKey: .id)
+        try container.encode(title, forKey: .title)
+        try container.encode(isCompleted, forKey: .isCompleted)
+        try container.encode(sortOrder, forKey: .sortOrder)
+        if !reminderIdentifiers.isEmpty {
+            try container.encode(reminderIdentifiers, forKey: .reminderIdentifiers)
+        }
+    }
+}
+
 struct WidgetChecklistSnapshot: Codable, Hashable, Sendable {
     let dayKey: String
     let generatedAt: Date
     let items: [WidgetChecklistItem]
 
     var completedCount: Int {
-        items.filter(\.isCompleted).count
+        items.reduce(into: 0) { count, item in
+            if item.isCompleted { count += 1 }
+        }
     }
 }
 
@@ -30,6 +62,28 @@ struct WidgetChecklistMutation: Codable, Hashable, Identifiable, Sendable {
     let reminderIdentifiers: [String]
 }
 
+/// Remembers the most recently decoded snapshot keyed by its raw bytes so
+/// repeated reads of unchanged defaults data skip the JSON decode.
+private final class SnapshotCache: @unchecked Sendable {
+    private let lock = NSLock()
+    private var data: Data?
+    private var snapshot: WidgetChecklistSnapshot?
+
+    func snapshot(for data: Data) -> WidgetChecklistSnapshot? {
+        lock.lock()
+        defer { lock.unlock() }
+        guard data == self.data else { return nil }
+        return snapshot
+    }
+
+    func store(_ snapshot: WidgetChecklistSnapshot, for data: Data) {
+        lock.lock()
+        self.data = data
+        self.snapshot = snapshot
+        lock.unlock()
+    }
+}
+
 enum WidgetChecklistStore {
     static let appGroupIdentifier = "group.com.jakemauldin.DayPlan"
     static let widgetKind = "DayPlanChecklistWidget"
@@ -40,18 +94,16 @@ enum WidgetChecklistStore {
     private static let maximumMutations = 200
     private static let maximumTitleLength = 160
 
+    private static let encoder = JSONEncoder()
+    private static let decoder = JSONDecoder()
+    private static let snapshotCache = SnapshotCache()
+
     static var sharedDefaults: UserDefaults? {
         UserDefaults(suiteName: appGroupIdentifier)
     }
 
     static func dayKey(for date: Date, calendar: Calendar = .current) -> String {
-        let components = calendar.dateComponents([.year, .month, .day], from: date)
-        return String(
-            format: "%04d-%02d-%02d",
-            components.year ?? 0,
-            components.month ?? 0,
-            components.day ?? 0
-        )
+        DateKeys.dayKey(for: date, calendar: calendar)
     }
 
     static func snapshot(
@@ -61,7 +113,7 @@ enum WidgetChecklistStore {
         guard
             let defaults = suppliedDefaults ?? sharedDefaults,
             let data = defaults.data(forKey: snapshotKey),
-            let snapshot = try? JSONDecoder().decode(WidgetChecklistSnapshot.self, from: data),
+            let snapshot = decodedSnapshot(from: data),
             snapshot.dayKey == dayKey(for: date)
         else {
             return nil
@@ -70,6 +122,17 @@ enum WidgetChecklistStore {
         return snapshot
     }
 
+    private static func decodedSnapshot(from data: Data) -> WidgetChecklistSnapshot? {
+        if let cached = snapshotCache.snapshot(for: data) {
+            return cached
+        }
+        guard let snapshot = try? decoder.decode(WidgetChecklistSnapshot.self, from: data) else {
+            return nil
+        }
+        snapshotCache.store(snapshot, for: data)
+        return snapshot
+    }
+
     @discardableResult
     static func save(
         _ snapshot: WidgetChecklistSnapshot,
@@ -98,8 +161,16 @@ enum WidgetChecklistStore {
             items: boundedItems
         )
 
-        guard let data = try? JSONEncoder().encode(boundedSnapshot) else { return false }
+        if let existingData = defaults.data(forKey: snapshotKey),
+           let existing = decodedSnapshot(from: existingData),
+           existing.dayKey == boundedSnapshot.dayKey,
+           existing.items == boundedSnapshot.items {
+            return true
+        }
+
+        guard let data = try? encoder.encode(boundedSnapshot) else { return false }
         defaults.set(data, forKey: snapshotKey)
+        snapshotCache.store(boundedSnapshot, for: data)
 
         if reloadWidgets {
             WidgetCenter.shared.reloadTimelines(ofKind: widgetKind)
@@ -162,7 +233,7 @@ enum WidgetChecklistStore {
         guard
             let defaults = suppliedDefaults ?? sharedDefaults,
             let data = defaults.data(forKey: mutationKey),
-            let mutations = try? JSONDecoder().decode([WidgetChecklistMutation].self, from: data)
+            let mutations = try? decoder.decode([WidgetChecklistMutation].self, from: data)
         else {
             return []
         }
@@ -180,7 +251,7 @@ enum WidgetChecklistStore {
     }
 
     private static func saveMutations(_ mutations: [WidgetChecklistMutation], defaults: UserDefaults) {
-        guard let data = try? JSONEncoder().encode(mutations) else { return }
+        guard let data = try? encoder.encode(mutations) else { return }
         defaults.set(data, forKey: mutationKey)
     }
 }
@@ -7,7 +7,8 @@ enum WidgetChecklistSync {
         defaults: UserDefaults? = nil,
         reloadWidgets: Bool = true
     ) {
-        guard DateKeys.dayKey(for: checklist.date) == DateKeys.dayKey(for: .now) else { return }
+        guard DateKeys.startOfDay(checklist.date) == DateKeys.startOfDay(.now) else { return }
+        let checklistDayKey = DateKeys.dayKey(for: checklist.date)
 
         let items = checklist.items
             .sorted {
@@ -29,7 +30,7 @@ enum WidgetChecklistSync {
             }
 
         let snapshot = WidgetChecklistSnapshot(
-            dayKey: DateKeys.dayKey(for: checklist.date),
+            dayKey: checklistDayKey,
             generatedAt: .now,
             items: items
         )
@@ -66,20 +67,23 @@ enum WidgetChecklistSync {
         let mutations = WidgetChecklistStore.pendingMutations(defaults: defaults)
         guard !mutations.isEmpty else { return }
 
+        let itemIDs = Array(Set(mutations.map(\.itemID)))
+        let descriptor = FetchDescriptor<DailyChecklistItem>(
+            predicate: #Predicate { item in
+                itemIDs.contains(item.id)
+            }
+        )
+        var itemsByID: [UUID: DailyChecklistItem] = [:]
+        for item in try context.fetch(descriptor) {
+            itemsByID[item.id] = item
+        }
+
         var acknowledgedIDs = Set<UUID>()
         var reminderIdentifiersToCancel = Set<String>()
         var didChange = false
 
         for mutation in mutations {
-            let itemID = mutation.itemID
-            var descriptor = FetchDescriptor<DailyChecklistItem>(
-                predicate: #Predicate { item in
-                    item.id == itemID
-                }
-            )
-            descriptor.fetchLimit = 1
-
-            guard let item = try context.fetch(descriptor).first else {
+            guard let item = itemsByID[mutation.itemID] else {
                 acknowledgedIDs.insert(mutation.id)
                 continue
             }
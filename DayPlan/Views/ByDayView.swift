@@ -27,11 +27,13 @@ struct ByDayView: View {
                 .datePickerStyle(.compact)
 
                 if let checklist {
+                    let completed = checklist.completedCount
+                    let total = checklist.items.count
                     ProgressView(
-                        value: Double(checklist.completedCount),
-                        total: Double(max(checklist.items.count, 1))
+                        value: Double(completed),
+                        total: Double(max(total, 1))
                     ) {
-                        Text("\(checklist.completedCount) of \(checklist.items.count) complete")
+                        Text("\(completed) of \(total) complete")
                     }
                     .tint(.green)
                 }
@@ -188,7 +190,7 @@ struct ByDayView: View {
         do {
             _ = try ChecklistStore.addItem(title: title, to: checklist, in: modelContext)
             newItemTitle = ""
-            loadChecklistAndSuggestion()
+            reloadSuggestion()
         } catch {
             errorMessage = error.localizedDescription
         }
@@ -210,7 +212,7 @@ struct ByDayView: View {
         reminderScheduler.cancelAll(for: item)
         do {
             try ChecklistStore.deleteItem(item, in: modelContext)
-            loadChecklistAndSuggestion()
+            reloadSuggestion()
         } catch {
             errorMessage = error.localizedDescription
         }
@@ -227,7 +229,7 @@ struct ByDayView: View {
                 for: selectedDate,
                 in: modelContext
             )
-            loadChecklistAndSuggestion()
+            reloadSuggestion()
         } catch {
             errorMessage = error.localizedDescription
         }
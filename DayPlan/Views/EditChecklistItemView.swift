@@ -84,8 +84,13 @@ struct EditChecklistItemView: View {
 
     private func save() {
         do {
-            try ChecklistStore.updateItem(item, title: title, notes: notes, in: modelContext)
-            try ChecklistStore.setPersistence(for: item, isPersistent: isPersistent, in: modelContext)
+            try ChecklistStore.updateItem(
+                item,
+                title: title,
+                notes: notes,
+                isPersistent: isPersistent,
+                in: modelContext
+            )
             try updateReminder()
             dismiss()
         } catch {
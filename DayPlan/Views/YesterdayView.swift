@@ -5,6 +5,7 @@ struct YesterdayView: View {
     @Environment(\.modelContext) private var modelContext
 
     @State private var events: [ContentEvent] = []
+    @State private var eventsBySource: [(sourceName: String, events: [ContentEvent])] = []
     @State private var digest: DailyContentDigest?
     @State private var isLoading = false
     @State private var errorMessage: String?
@@ -40,9 +41,9 @@ struct YesterdayView: View {
                     )
                 }
             } else {
-                ForEach(groupedSourceNames, id: \.self) { sourceName in
-                    Section(sourceName) {
-                        ForEach(eventsForSource(sourceName)) { event in
+                ForEach(eventsBySource, id: \.sourceName) { group in
+                    Section(group.sourceName) {
+                        ForEach(group.events) { event in
                             ContentEventRow(event: event)
                         }
                     }
@@ -74,10 +75,6 @@ struct YesterdayView: View {
         })
     }
 
-    private var groupedSourceNames: [String] {
-        Array(Set(events.map(\.sourceName))).sorted()
-    }
-
     private var errorBinding: Binding<Bool> {
         Binding(
             get: { errorMessage != nil },
@@ -85,12 +82,6 @@ struct YesterdayView: View {
         )
     }
 
-    private func eventsForSource(_ sourceName: String) -> [ContentEvent] {
-        events
-            .filter { $0.sourceName == sourceName }
-            .sorted { $0.receivedAt > $1.receivedAt }
-    }
-
     @MainActor
     private func loadDigest() async {
         isLoading = true
@@ -104,6 +95,9 @@ struct YesterdayView: View {
                 until: DateKeys.dayAfter(yesterday),
                 in: modelContext
             )
+            eventsBySource = Dictionary(grouping: events, by: \.sourceName)
+                .map { (sourceName: $0.key, events: $0.value) }
+                .sorted { $0.sourceName < $1.sourceName }
         } catch {
             errorMessage = error.localizedDescription
         }
@@ -139,7 +139,17 @@ struct DayPlanChecklistWidgetView: View {
 
     private var visibleItems: [WidgetChecklistItem] {
         guard let items = entry.snapshot?.items else { return [] }
-        return items.filter { !$0.isCompleted } + items.filter(\.isCompleted)
+        var pending: [WidgetChecklistItem] = []
+        var completed: [WidgetChecklistItem] = []
+        pending.reserveCapacity(items.count)
+        for item in items {
+            if item.isCompleted {
+                completed.append(item)
+            } else {
+                pending.append(item)
+            }
+        }
+        return pending + completed
     }
 
     private var completedCount: Int {